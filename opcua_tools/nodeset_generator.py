@@ -18,7 +18,6 @@ import time
 from datetime import datetime
 from io import StringIO
 from typing import List, Optional, Union
-from xml.sax.saxutils import escape
 
 import lxml.etree as ET
 import numpy as np
@@ -26,7 +25,7 @@ import pandas as pd
 import pytz
 
 from opcua_tools import memory_optimizer
-from opcua_tools.ua_data_types import UANodeId
+from opcua_tools.ua_data_types import UANodeId, cached_escape, xml_encode_many
 from opcua_tools.validator import value_validator
 
 PATH_HERE = os.path.dirname(__file__)
@@ -179,9 +178,10 @@ def encode_values(nodes):
     if "Value" in nodes.columns.values:
         has_value = ~nodes["Value"].isna()
         should_encode = is_variable & has_value
-        nodes.loc[should_encode, "EncodedValue"] = nodes.loc[
-            should_encode, "Value"
-        ].map(lambda x: x.xml_encode(include_xmlns=True))
+        values = nodes.loc[should_encode, "Value"]
+        nodes.loc[should_encode, "EncodedValue"] = pd.Series(
+            xml_encode_many(values, include_xmlns=True), index=values.index
+        )
     else:
         nodes["EncodedValue"] = np.nan
 
@@ -196,7 +196,8 @@ def generate_nodes_xml(
         nodes["BrowseNameNamespace"].isna().sum() == 0
     ), "Should not have missing BrowseNameNamespaces"
 
-    replacer = lambda x: x.map(escape)
+    # Names and reference ids repeat a lot, so the memoized escape is used
+    replacer = lambda x: x.map(cached_escape)
     nodes["DisplayName"] = replacer(nodes["DisplayName"])
     nodes["BrowseName"] = replacer(nodes["BrowseName"])
     nodes["Description"] = replacer(nodes["Description"])
@@ -214,6 +215,8 @@ def generate_nodes_xml(
 
     encode_values(nodes)
     encode_definitions(nodes)
+    # NodeClass is categorical, string concatenation needs plain strings
+    nodes["NodeClass"] = nodes["NodeClass"].astype(str)
     nodes["nodexml"] = "<" + nodes["NodeClass"] + ' NodeId="' + nodes["NodeId"] + '"'
     if ["SymbolicName"] in nodes.columns.values:
         hasSymbolicName = ~nodes["SymbolicName"].isna()
@@ -247,15 +250,15 @@ def generate_nodes_xml(
         "WriteMask",
     ]:
         if a in nodes.columns.values:
-            notna = ~nodes[a].isna()
-            haslen = nodes[a].astype(str).str.len() > 0
+            # The column is converted to text once, for both the check and the value
+            as_str = nodes[a].astype(str)
+            has_attribute = ~nodes[a].isna() & (as_str.str.len() > 0)
+            use_value = as_str[has_attribute]
             if a in ("IsAbstract", "Symmetric", "Historizing"):
-                use_value = nodes.loc[notna & haslen, a].astype(str).str.lower()
-            else:
-                use_value = nodes.loc[notna & haslen, a].astype(str)
+                use_value = use_value.str.lower()
 
-            nodes.loc[notna & haslen, "nodexml"] = (
-                nodes.loc[notna & haslen, "nodexml"] + a + '="' + use_value + '" '
+            nodes.loc[has_attribute, "nodexml"] = (
+                nodes.loc[has_attribute, "nodexml"] + a + '="' + use_value + '" '
             )
 
     nodes["nodexml"] = nodes["nodexml"] + ">"
@@ -315,9 +318,10 @@ def generate_nodes_xml(
 def encode_definitions(nodes: pd.DataFrame):
     if "Definition" in nodes.columns.values:
         has_definition = ~nodes["Definition"].isna()
-        nodes.loc[has_definition, "EncodedDefinition"] = nodes.loc[
-            has_definition, "Definition"
-        ].map(lambda x: x.xml_encode(include_xmlns=False))
+        definitions = nodes.loc[has_definition, "Definition"]
+        nodes.loc[has_definition, "EncodedDefinition"] = pd.Series(
+            xml_encode_many(definitions, include_xmlns=False), index=definitions.index
+        )
 
 
 def create_nodeset2_file(
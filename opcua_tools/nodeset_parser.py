@@ -11,13 +11,13 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import itertools
+import functools
 import json
 import logging
+import multiprocessing
 import os
-import re
 from io import BytesIO
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import lxml.etree as ET
 import numpy as np
@@ -35,53 +35,33 @@ from opcua_tools.value_parser import parse_nodeid, parse_value
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
-tagsplit = re.compile(r"({.*\})(.*)")
 OPCFOUNDATION_NAMESPACE = "http://opcfoundation.org/UA/"
-
-
-def findrefs(
-    elem, uaxsd, namespace_map: Dict[int, int], alias_map: Dict[str, UANodeId]
-):
-    return [
-        (
-            parse_nodeid(r.text.rstrip(), namespace_map, alias_map),
-            fix_ref_attrib(r, namespace_map, alias_map),
-        )
-        for refs in elem.findall(uaxsd + "References")
-        for r in refs.findall(uaxsd + "Reference")
-    ]
-
-
-def findval(elem, uaxsd):
-    val = elem.find(uaxsd + "Value")
-    if val is None:
-        return pd.NA
-    if len(val) < 1:
-        return pd.NA
-
-    return parse_value(val)
-
-
-def finddisplayname(elem, uaxsd):
-    val = elem.find(uaxsd + "DisplayName")
-    if val is None:
-        return ""
-
-    if val.text is None:
-        return ""
-
-    return val.text.rstrip()
-
-
-def finddescription(elem, uaxsd):
-    val = elem.find(uaxsd + "Description")
-    if val is None:
-        return ""
-
-    if val.text is None:
-        return ""
-
-    return val.text.rstrip()
+REFERENCE_COLUMNS = ["Src", "Trg", "ReferenceType"]
+NODECLASSES = [
+    "UAObjectType",
+    "UAObject",
+    "UAVariableType",
+    "UAVariable",
+    "UADataType",
+    "UAReferenceType",
+    "UAView",
+    "UAMethod",
+]
+# Columns of the nodes from iterparse_xml that are not xml attributes
+NODE_COLUMNS = ["index", "NodeClass", "DisplayName", "Description", "Value"]
+NODEID_ATTRIBUTES = ["NodeId", "ParentNodeId", "DataType", "MethodDeclarationId"]
+BOOLEAN_ATTRIBUTES = ["IsAbstract", "Symmetric"]
+INTEGER_ATTRIBUTES = {
+    "ns": "Int8",
+    "ValueRank": "Int8",
+    "MinimumSamplingInterval": "Int32",
+    "AccessLevel": "Int8",
+    "EventNotifier": "Int8",
+}
+UAXSD = "{http://opcfoundation.org/UA/2011/03/UANodeSet.xsd}"
+NODESET_TAG = UAXSD + "UANodeSet"
+NODECLASSES_XSD = frozenset(UAXSD + n for n in NODECLASSES)
+ALIASNSES = frozenset(UAXSD + n for n in ["NamespaceUris", "Uri", "Alias"])
 
 
 def parse_node_attrib(
@@ -115,55 +95,111 @@ def parse_node_attrib(
     return attrib
 
 
-def fix_ref_attrib(
-    elem: ET.ElementBase, namespace_map: Dict[int, int], alias_map: Dict[str, UANodeId]
-) -> Dict[str, str]:
-    """
-    Parses the xml element for the reference and maps ReferenceType  in the attribute Dictionary.
-
-    Parameters:
-    elem (XML element): the XML element to parse
-    namespace_map (Dict[str,str]): The dictionary used for mapping of ns index
-
-    Returns:
-    Dict[str,str] with attributes according to the reference xml element
-    """
-    attrib = dict(elem.attrib)
-    attrib["ReferenceType"] = parse_nodeid(
-        attrib["ReferenceType"], namespace_map, alias_map=alias_map
-    )
-    return attrib
-
-
 def process_elem_batch(
     elems: List[ET.ElementBase],
     uaxsd: str,
     namespace_map: Dict[int, int],
     alias_map: Dict[str, UANodeId],
-) -> pd.DataFrame:
+) -> Tuple[pd.DataFrame, List[Tuple[UANodeId, UANodeId, UANodeId]]]:
     """
-    Creates a Pandas DataFrame with node and reference info based on the provided XML element list
+    Creates a Pandas DataFrame with node info and a list of references based on the provided XML element list.
+    The elements are cleared once they have been processed.
 
     Parameters:
 
     Returns:
-    Pandas DataFrame with columns:[Tag,Attrib,DisplayName, Description, References, ValueTmp]
+    Pandas DataFrame with columns:[Tag, DisplayName, Description, Value] followed by one column per
+    attribute found on the elements, None where an element does not have the attribute, and the
+    namespace of the NodeId in 'ns'
+    List of (Src, Trg, ReferenceType) tuples, inverse references are flipped so that Src is always the source
 
     """
-    df = pd.DataFrame({"elem": elems})
-    df["Tag"] = df["elem"].map(lambda x: x.tag).str.replace(uaxsd, "", regex=True)
-    df["Attrib"] = df["elem"].map(
-        lambda x: parse_node_attrib(x, namespace_map, alias_map)
-    )
-    df["DisplayName"] = df["elem"].map(lambda x: finddisplayname(x, uaxsd))
-    df["Description"] = df["elem"].map(lambda x: finddescription(x, uaxsd))
-    df["References"] = df["elem"].map(
-        lambda x: findrefs(x, uaxsd, namespace_map, alias_map)
+    display_name_tag = uaxsd + "DisplayName"
+    description_tag = uaxsd + "Description"
+    value_tag = uaxsd + "Value"
+    references_tag = uaxsd + "References"
+    reference_tag = uaxsd + "Reference"
+
+    uaxsd_len = len(uaxsd)
+    n = len(elems)
+    tags = [None] * n
+    attrib_columns = {}
+    namespaces = np.empty(n, dtype=np.int8)
+    display_names = [""] * n
+    descriptions = [""] * n
+    reference_records = []
+    values = [pd.NA] * n
+    # Reference targets and types repeat a lot, so each distinct text is parsed once.
+    # UANodeIds are immutable and can be shared.
+    nodeid_cache = {}
+
+    # Walk every element and its children once, only the first DisplayName,
+    # Description and Value of an element are used
+    for i, elem in enumerate(elems):
+        tag = elem.tag
+        tags[i] = tag[uaxsd_len:] if tag.startswith(uaxsd) else tag
+        attrib = parse_node_attrib(elem, namespace_map, alias_map)
+        for name, attrib_value in attrib.items():
+            column = attrib_columns.get(name)
+            if column is None:
+                column = attrib_columns[name] = [None] * n
+            column[i] = attrib_value
+        src = attrib["NodeId"]
+        # Keep the namespace of the NodeId while we have it, saves a pass over all nodes later
+        namespaces[i] = src.namespace
+        found_display_name = found_description = found_value = False
+        for child in elem:
+            child_tag = child.tag
+            if child_tag == references_tag:
+                for r in child:
+                    if r.tag == reference_tag:
+                        trg_text = r.text
+                        trg = nodeid_cache.get(trg_text)
+                        if trg is None:
+                            trg = parse_nodeid(
+                                trg_text.rstrip(), namespace_map, alias_map
+                            )
+                            nodeid_cache[trg_text] = trg
+                        ref_attrib = r.attrib
+                        reference_type_text = ref_attrib["ReferenceType"]
+                        reference_type = nodeid_cache.get(reference_type_text)
+                        if reference_type is None:
+                            reference_type = parse_nodeid(
+                                reference_type_text, namespace_map, alias_map
+                            )
+                            nodeid_cache[reference_type_text] = reference_type
+                        if ref_attrib.get("IsForward") == "false":
+                            reference_records.append((trg, src, reference_type))
+                        else:
+                            reference_records.append((src, trg, reference_type))
+            elif child_tag == display_name_tag and not found_display_name:
+                found_display_name = True
+                if child.text is not None:
+                    display_names[i] = child.text.rstrip()
+            elif child_tag == description_tag and not found_description:
+                found_description = True
+                if child.text is not None:
+                    descriptions[i] = child.text.rstrip()
+            elif child_tag == value_tag and not found_value:
+                found_value = True
+                if len(child) > 0:
+                    values[i] = parse_value(child)
+        # Everything needed is extracted, release the memory held by the element
+        elem.clear()
+
+    df = pd.DataFrame(
+        {
+            "Tag": pd.Categorical(tags, categories=sorted(NODECLASSES)),
+            "DisplayName": display_names,
+            "Description": descriptions,
+            "Value": values,
+        }
     )
-    df["Value"] = df["elem"].map(lambda x: findval(x, uaxsd))
-    df = df.drop(columns="elem")
     df = df.convert_dtypes()
-    return df
+    # The attribute columns get their dtypes once all batches are combined
+    attrib_columns["ns"] = namespaces
+    df = pd.concat([df, pd.DataFrame(attrib_columns)], axis=1)
+    return df, reference_records
 
 
 def iterparse_xml(
@@ -177,12 +213,14 @@ def iterparse_xml(
     desired_namespace_list (List[str]): The list with namspace uris in the desired order.
 
     Returns:
-    Dictionary (str,object): The with dictionary with pd.Dataframe in 'nodes' key and alias dict in 'alias_map' key
+    Dictionary (str,object): The with dictionary with pd.Dataframe in 'nodes' key, a list of
+    (Src, Trg, ReferenceType) tuples in 'reference_records' key and alias dict in 'alias_map' key
     Node Dataframe example:
-     Tag                                             Attrib                                          References                                           ValueTmp
-    ['UAVariable'    {'NodeId': '0:0:8244', 'BrowseName': 'Annotation', 'ParentNodeId': '0:0:7617', 'DataType': 'String'}   'Annotation' None
+     Tag           DisplayName  Description  Value  NodeId     BrowseName    ns  ParentNodeId  DataType
+    ['UAVariable'  'Annotation' ''           None   '0:0:8244' 'Annotation'  0   '0:0:7617'    'String'
 
-    list([('0:0:69', {'ReferenceType': 'HasTypeDefinition'}), ('0:0:7617', {'ReferenceType': 'HasComponent', 'IsForward': 'false'})])
+    Reference records example:
+    [('0:0:8244', '0:0:69', 'HasTypeDefinition'), ('0:0:7617', '0:0:8244', 'HasComponent')]
 
     """
     if not xmlfile.endswith("_parsed.json"):
@@ -190,119 +228,120 @@ def iterparse_xml(
     else:
         json_file_path = xmlfile
 
-    uaxsd = "{http://opcfoundation.org/UA/2011/03/UANodeSet.xsd}"
-
-    tags_to_find = list(
-        map(
-            lambda x: uaxsd + x,
-            ["NamespaceUris", "Uri", "Model", "RequiredModel", "Alias"],
-        )
-    )
-    namespace_list = []
     alias_map = {}
 
-    nodeclasses = [
-        "UAObjectType",
-        "UAObject",
-        "UAVariableType",
-        "UAVariable",
-        "UADataType",
-        "UAReferenceType",
-        "UAView",
-        "UAMethod",
-    ]
-    nodeclasses_xsd = list(map(lambda x: uaxsd + x, nodeclasses))
-
-    nodeset = uaxsd + "UANodeSet"
-
     tagiter = ET.iterparse(
         xmlfile,
-        events=("start", "end"),
-        tag=[nodeset] + nodeclasses_xsd + tags_to_find,
+        events=("end",),
+        tag=[NODESET_TAG, *NODECLASSES_XSD, *ALIASNSES],
         encoding="utf-8",
+        # Whitespace between elements is dropped. This changes the text stored for
+        # XmlElement values, and so the generated ExtensionObject bodies, which lose
+        # their indentation. xml:id attributes are never looked up
+        remove_blank_text=True,
+        collect_ids=False,
+        huge_tree=True,
     )
 
     elems = []
     df_list = []
+    references = []
     i = 1
-    foundnses = False
     namespace_map = {0: 0}
     models = []
     current_model = None
     models: List[ModelLine] = []
 
-    with open(json_file_path, "r") as f:
-        for line in f.readlines():
-            line = json.loads(line)
-            if line["elem_type"] == "UANodeSet":
-                line: UANodeSetLine
-                continue
-            elif line["elem_type"] == "NamespaceUris":
-                line: NameSpaceURIsLine
-                extend_namespace_map(
-                    desired_namespace_list, line["uris"], namespace_map
-                )
-            elif line["elem_type"] == "Models":
-                line: ModelsLine
+    for line in iter_json_header_lines(json_file_path):
+        if line["elem_type"] == "NamespaceUris":
+            line: NameSpaceURIsLine
+            extend_namespace_map(desired_namespace_list, line["uris"], namespace_map)
+        elif line["elem_type"] == "Models":
+            line: ModelsLine
+            m: ModelLine
+            for m in line["models"]:
                 m: ModelLine
-                for m in line["models"]:
-                    m: ModelLine
-                    models.append(m)
-            else:
-                break
+                models.append(m)
+
+    def on_uri_end(elem):
+        elem.clear()
+
+    def on_alias_end(elem):
+        alias_map[elem.attrib["Alias"]] = parse_nodeid(elem.text, namespace_map)
+        elem.clear()
+
+    def on_node_end(elem):
+        elems.append(elem)
+        # Detach the previous siblings from the root, otherwise lxml keeps every
+        # parsed node in the tree until the whole document has been read.
+        # The elements in the current batch stay alive through the elems list.
+        parent = elem.getparent()
+        while elem.getprevious() is not None:
+            del parent[0]
+
+    # Namespaces and models are read from the json file, the remaining tags
+    # (UANodeSet, NamespaceUris) need no handling
+    handlers = {
+        UAXSD + "Uri": on_uri_end,
+        UAXSD + "Alias": on_alias_end,
+    }
+    for nodeclass_xsd in NODECLASSES_XSD:
+        handlers[nodeclass_xsd] = on_node_end
 
-    for event, elem in tagiter:
-        if elem.tag == nodeset:
-            if event == "start":
-                elem.nsmap.copy()
-            if event == "end":
-                pass
-        elif not foundnses and event == "end" and elem.tag == uaxsd + "Uri":
-            namespace_list.append(elem.text)
-            elem.clear()
-        elif not foundnses and event == "end" and elem.tag == uaxsd + "NamespaceUris":
-            # All uris in "NamespaceUris" are parsed
-            foundnses = True
-        elif elem.tag == f"{uaxsd}Model":
-            continue
-        elif elem.tag == f"{uaxsd}RequiredModel":
-            if event == "start":
-                continue
-        elif event == "end" and elem.tag == uaxsd + "Alias":
-            alias_map[elem.attrib["Alias"]] = parse_nodeid(elem.text, namespace_map)
-            elem.clear()
-        elif event == "end":
-            elems.append(elem)
+    for _, elem in tagiter:
+        handler = handlers.get(elem.tag)
+        if handler is not None:
+            handler(elem)
         if i % batchsize == 0:
             logger.info(f"Processing XML node batch {i}")
-            df = process_elem_batch(
+            df, reference_records = process_elem_batch(
                 elems=elems,
-                uaxsd=uaxsd,
+                uaxsd=UAXSD,
                 namespace_map=namespace_map,
                 alias_map=alias_map,
             )
             df_list.append(df)
-            # Release memory
-            list(map(lambda x: x.clear(), elems))
-            elems = []
+            references.extend(reference_records)
+            elems.clear()
         i = i + 1
 
     if len(elems) > 0:
-        df = process_elem_batch(elems, uaxsd, namespace_map, alias_map)
-        # Release memory
-        list(map(lambda x: x.clear(), elems))
+        df, reference_records = process_elem_batch(
+            elems, UAXSD, namespace_map, alias_map
+        )
         df_list.append(df)
+        references.extend(reference_records)
 
-    nodes = pd.concat(df_list)
+    # Most files fit in one batch, and then there is nothing to concatenate
+    if len(df_list) == 1:
+        nodes = df_list[0]
+    else:
+        nodes = pd.concat(df_list)
 
     return {
         "nodes": nodes,
+        "reference_records": references,
         "alias_map": alias_map,
         "namespace_map": namespace_map,
         "models": models,
     }
 
 
+def iter_json_header_lines(
+    json_file_path: str,
+) -> Iterator[Union[UANodeSetLine, NameSpaceURIsLine, ModelsLine]]:
+    """Yields the UANodeSet, NamespaceUris and Models lines found at the start of
+    a json file made by pre_process_xml_to_json. The file is read line by line
+    and left as soon as the first line of another type is reached.
+    """
+    with open(json_file_path, "r") as f:
+        for line in f:
+            line = json.loads(line)
+            if line["elem_type"] not in ("UANodeSet", "NamespaceUris", "Models"):
+                break
+            yield line
+
+
 def extend_namespace_map(
     existing_namespaces: List[str],
     namespace_list: List[str],
@@ -339,27 +378,30 @@ def normalize_wrt_nodeid(nodes: pd.DataFrame, references: pd.DataFrame) -> pd.Da
     nodecols = ["NodeId", "ParentNodeId", "DataType", "MethodDeclarationId"]
     refcols = ["Src", "Trg", "ReferenceType"]
 
+    id_columns = [(nodes, c) for c in nodecols if c in nodes.columns.values] + [
+        (references, c) for c in refcols if c in references.columns.values
+    ]
+    notna_masks = [df[c].notna().to_numpy() for df, c in id_columns]
     allids = pd.concat(
-        [nodes[c].dropna() for c in nodecols if c in nodes.columns.values]
-        + [references[c].dropna() for c in refcols if c in references.columns.values],
+        [df[c][notna] for (df, c), notna in zip(id_columns, notna_masks)],
         ignore_index=True,
     )
     codes, uniques = pd.factorize(allids)
 
     lookup_df = pd.DataFrame({"uniques": uniques})
 
-    uniques_index = pd.Index(uniques)
-    convert_to_int_index = lambda x: uniques_index.get_indexer(pd.Index(x)).astype(
-        pd.Int32Dtype
-    )
-    for c in refcols:
-        references[c] = convert_to_int_index(references[c])
+    # The codes of allids are the ids, split them back into the columns they came from
+    offsets = np.cumsum([notna.sum() for notna in notna_masks])[:-1]
+    for (df, c), notna, column_codes in zip(
+        id_columns, notna_masks, np.split(codes, offsets)
+    ):
+        ids = np.zeros(len(notna), dtype=np.int32)
+        ids[notna] = column_codes
+        # NodeIds are kept, their ids go in a separate column
+        df["id" if c == "NodeId" else c] = pd.arrays.IntegerArray(ids, ~notna)
 
-    nodes["id"] = convert_to_int_index(nodes["NodeId"])
-    for c in nodecols[1:]:  # Skip nodeids!
-        if c in nodes.columns.values:
-            nodes[c] = convert_to_int_index(nodes[c])
-            nodes[c] = nodes[c].replace(-1, pd.NA)
+    # Deduplicating on the integer ids is much cheaper than on the NodeId objects
+    references.drop_duplicates(subset=refcols, inplace=True, ignore_index=True)
 
     logger.info("Finished normalizing table structure with respect to nodeid")
     return lookup_df
@@ -376,7 +418,7 @@ def get_xml_namespaces(xml_file: str) -> List[str]:
         List[str] containing the different namespace uris which are found in the file.
 
     """
-    uaxsd = "{http://opcfoundation.org/UA/2011/03/UANodeSet.xsd}"
+    uaxsd = UAXSD
 
     namespace_list = []
     # In some NodeSet2 definition files the <Model> tag is not found
@@ -386,6 +428,18 @@ def get_xml_namespaces(xml_file: str) -> List[str]:
         namespace_list.append(OPCFOUNDATION_NAMESPACE)
         return namespace_list
 
+    # The json file made by pre_process_xml_to_json has the ModelUris in its
+    # header, which saves parsing the whole xml file. It is only used if it is
+    # not older than the xml file.
+    json_file_path = xml_file + "_parsed.json"
+    if os.path.exists(json_file_path) and os.path.getmtime(
+        json_file_path
+    ) >= os.path.getmtime(xml_file):
+        for line in iter_json_header_lines(json_file_path):
+            if line["elem_type"] == "Models":
+                namespace_list.extend(uri for uri in line["uris"] if uri)
+        return namespace_list
+
     # Adding tags which contain Models and ModelUri.
     tree = ET.parse(xml_file)
     root = tree.getroot()
@@ -417,6 +471,14 @@ def get_xml_namespaces(xml_file: str) -> List[str]:
     return namespace_list
 
 
+@functools.lru_cache(maxsize=None)
+def cached_get_xml_namespaces(xml_file: str, mtime: float) -> Tuple[str, ...]:
+    """Memoized get_xml_namespaces. The modification time of the file is part of
+    the cache key, so that the namespaces are read again if the file changes.
+    """
+    return tuple(get_xml_namespaces(xml_file))
+
+
 def get_namespace_data_from_file(xml_file: str) -> dict:
     """Opens the xml file provided and peeks inside the file to look for Namespace tags
     to resolve which namespaces it includes.
@@ -440,7 +502,7 @@ def get_namespace_data_from_file(xml_file: str) -> dict:
     else:
         json_file_path = xml_file
 
-    uaxsd = "{http://opcfoundation.org/UA/2011/03/UANodeSet.xsd}"
+    uaxsd = UAXSD
 
     # In some NodeSet2 definition files the <Model> tag is not found
     # therefore using the common files name as well.
@@ -522,22 +584,27 @@ def exclude_files_not_in_namespaces(
 
     """
     # Removes None for the list if found in the namespaces
-    namespaces_set_list = list(set(filter(None, namespaces)))
-    output_files = input_files.copy()
-    for file in input_files:
-        file_ns_uris = get_xml_namespaces(file)
-        # Removes file if none of the file_ns_uris are in namespaces_set_list
-        if not any(file in file_ns_uris for file in namespaces_set_list):
-            output_files.remove(file)
-
-    return output_files
+    wanted_namespaces = set(filter(None, namespaces))
+    # Keeps file only if any of its namespace uris are in wanted_namespaces
+    return [
+        file
+        for file in input_files
+        if not wanted_namespaces.isdisjoint(
+            cached_get_xml_namespaces(file, os.path.getmtime(file))
+        )
+    ]
 
 
 def parse_xml(
     xmlfile: Union[str, BytesIO], namespaces: Optional[List[str]] = None
 ) -> Dict[str, Any]:
-    parse_dict = parse_xml_without_normalization(xmlfile, namespaces)
-    lookup_df = normalize_wrt_nodeid(parse_dict["nodes"], parse_dict["references"])
+    parse_dict = parse_xml_records(xmlfile, namespaces)
+    # Duplicate references are dropped by normalize_wrt_nodeid
+    references = pd.DataFrame(
+        parse_dict.pop("reference_records"), columns=REFERENCE_COLUMNS
+    )
+    parse_dict["references"] = references
+    lookup_df = normalize_wrt_nodeid(parse_dict["nodes"], references)
     parse_dict["lookup_df"] = lookup_df
     return parse_dict
 
@@ -545,6 +612,26 @@ def parse_xml(
 def parse_xml_without_normalization(
     xmlfile: Union[str, BytesIO], namespaces: Optional[List[str]] = None
 ) -> Dict[str, Any]:
+    parse_dict = parse_xml_records(xmlfile, namespaces)
+    return {
+        "nodes": parse_dict["nodes"],
+        "references": pd.DataFrame(
+            parse_dict["reference_records"], columns=REFERENCE_COLUMNS
+        ).drop_duplicates(ignore_index=True),
+        "namespaces": parse_dict["namespaces"],
+        "models": parse_dict["models"],
+    }
+
+
+def parse_xml_records(
+    xmlfile: Union[str, BytesIO], namespaces: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """Same as parse_xml_without_normalization, but the references are returned as
+    a list of (Src, Trg, ReferenceType) tuples in 'reference_records'. This lets
+    callers parsing several files build a single references DataFrame at the end.
+    The records are not deduplicated, normalize_wrt_nodeid drops duplicates once
+    the references are integer ids.
+    """
     if namespaces is None:
         namespaces = []
 
@@ -556,115 +643,79 @@ def parse_xml_without_normalization(
     nodes = parse_dict["nodes"].reset_index()
     nodes = nodes.rename(columns={"Tag": "NodeClass"})
 
-    attrib_df = get_attrib_df(nodes)
-    attrib_df = attrib_df.fillna(pd.NA)
-    nodes = pd.concat([nodes, attrib_df], axis=1).drop(columns="Attrib")
-
-    references = nodes.loc[:, ["NodeId", "References"]]
-    references = (
-        references.rename(columns={"NodeId": "Src"})
-        .explode("References")
-        .reset_index(drop=True)
-    )
-    references = references.loc[~references["References"].isna()]
-
-    references["Trg"] = references["References"].map(lambda x: x[0])
-    references["IsForward"] = references["References"].map(
-        lambda x: (
-            False if "IsForward" in x[1] and x[1]["IsForward"] == "false" else True
-        )
-    )
-    refsrc = references[["Src"]]
-    references.loc[~references["IsForward"], "Src"] = references.loc[
-        ~references["IsForward"], "Trg"
-    ]
-    references.loc[~references["IsForward"], "Trg"] = refsrc.loc[
-        ~references["IsForward"], "Src"
-    ]
+    convert_attrib_dtypes(nodes)
 
-    references["ReferenceType"] = references["References"].map(
-        lambda x: x[1]["ReferenceType"]
-    )
-    references = references.drop(columns=["References", "IsForward"])
-    references = references.drop_duplicates().reset_index(drop=True)
-    nodes = nodes.drop(columns=["References", "index"])
+    nodes = nodes.drop(columns="index")
 
     # Browsenames are prefixed with namespace indices, but this makes for difficult to follow browsepaths.
     # We keep Browsename namespaces in its own column in order not to lose this information
     namespace_map = parse_dict["namespace_map"]
-    nodes["BrowseNameNamespace"] = nodes["BrowseName"].map(
-        lambda x: int(x.split(":")[0]) if ":" in x else 0
-    )
-    nodes["BrowseNameNamespace"] = nodes["BrowseNameNamespace"].map(namespace_map)
-    nodes["BrowseName"] = (
-        nodes["BrowseName"]
-        .map(lambda x: x.split(":")[1] if ":" in x else x)
-        .astype("str")
+    browse_names, browse_name_namespaces = split_browse_names(
+        nodes["BrowseName"].to_numpy(), namespace_map
     )
+    nodes["BrowseNameNamespace"] = browse_name_namespaces
+    nodes["BrowseName"] = browse_names
 
     if "Value" not in nodes.columns.values:
         nodes["Value"] = pd.NA
 
-    nodes["ns"] = nodes["NodeId"].map(lambda x: x.namespace).astype(pd.Int8Dtype())
+    # Namespace of NodeId was collected when parsing the nodes, it goes last
+    nodes["ns"] = nodes.pop("ns")
     models = parse_dict["models"]
     return {
         "nodes": nodes,
-        "references": references,
+        "reference_records": parse_dict["reference_records"],
         "namespaces": namespaces,
         "models": models,
     }
 
 
-def get_attrib_df(nodes: pd.DataFrame) -> pd.DataFrame:
-    attrib_df = pd.DataFrame.from_records(nodes["Attrib"].values)
-
-    is_abstract_column_name = "IsAbstract"
-    if is_abstract_column_name in attrib_df.columns:
-        attrib_df[is_abstract_column_name] = attrib_df[is_abstract_column_name].replace(
-            {np.nan: False, "false": False}
-        )
-        attrib_df[is_abstract_column_name] = attrib_df[is_abstract_column_name].astype(
-            "bool"
-        )
-
-    symmetric_column_name = "Symmetric"
-    if symmetric_column_name in attrib_df.columns:
-        attrib_df[symmetric_column_name] = attrib_df[symmetric_column_name].replace(
-            {np.nan: False, "false": False}
-        )
-        attrib_df[symmetric_column_name] = attrib_df[symmetric_column_name].astype(
-            "bool"
-        )
-
-    attrib_df = attrib_df.convert_dtypes()
-
-    value_rank_column_name = "ValueRank"
-    if value_rank_column_name in attrib_df.columns:
-        attrib_df[value_rank_column_name] = attrib_df[value_rank_column_name].astype(
-            "Int8"
-        )
-
-    minimum_sampling_interval_column_name = "MinimumSamplingInterval"
-    if minimum_sampling_interval_column_name in attrib_df.columns:
-        attrib_df[minimum_sampling_interval_column_name] = attrib_df[
-            minimum_sampling_interval_column_name
-        ].astype("Int32")
-
-    access_level_column_name = "AccessLevel"
-    if access_level_column_name in attrib_df.columns:
-        attrib_df[access_level_column_name] = attrib_df[
-            access_level_column_name
-        ].astype("Int8")
-
-    event_notifier_column_name = "EventNotifier"
-    if event_notifier_column_name in attrib_df.columns:
-        attrib_df["EventNotifier"] = attrib_df["EventNotifier"].astype("Int8")
-
-    return attrib_df
+def split_browse_names(
+    browse_names: np.ndarray, namespace_map: Dict[int, int]
+) -> Tuple[List[str], List[int]]:
+    """Splits browsenames such as '1:Name' into the name and the namespace index
+    mapped through namespace_map, in a single pass over the browsenames.
+    Browsenames without a prefix are in namespace 0. Like split(":")[1], the
+    name ends at a second colon if there is one.
+    """
+    names = []
+    namespaces = []
+    for browse_name in browse_names:
+        prefix, sep, name = browse_name.partition(":")
+        if sep:
+            names.append(name.partition(":")[0])
+            namespaces.append(namespace_map.get(int(prefix)))
+        else:
+            names.append(browse_name)
+            namespaces.append(namespace_map.get(0))
+    return names, namespaces
+
+
+def convert_attrib_dtypes(nodes: pd.DataFrame) -> None:
+    """Gives the attribute columns of the nodes from iterparse_xml their final dtype.
+    Every column is converted once, the xml attributes that are not listed in
+    NODEID_ATTRIBUTES, BOOLEAN_ATTRIBUTES or INTEGER_ATTRIBUTES are strings.
+    """
+    for column_name in nodes.columns.difference(NODE_COLUMNS, sort=False):
+        values = nodes[column_name]
+        if column_name in NODEID_ATTRIBUTES:
+            nodes[column_name] = values.fillna(pd.NA)
+        elif column_name in BOOLEAN_ATTRIBUTES:
+            # A missing attribute means false
+            nodes[column_name] = pd.array(
+                values.notna() & (values != "false") & (values != ""),
+                dtype="boolean",
+            )
+        elif column_name in INTEGER_ATTRIBUTES:
+            nodes[column_name] = pd.array(values, dtype=INTEGER_ATTRIBUTES[column_name])
+        else:
+            nodes[column_name] = pd.array(values, dtype="string")
 
 
 def parse_xml_dir(
-    xml_dir: str, namespaces: Optional[List[str]] = None
+    xml_dir: str,
+    namespaces: Optional[List[str]] = None,
+    processes: Optional[int] = None,
 ) -> Dict[str, Any]:
     """Parses xml directory and creates Pandas tables which contains
     a consolidated nodes, references, namespaces, and lookup_df
@@ -676,6 +727,7 @@ def parse_xml_dir(
     Args:
         xml_dir (str): Full path to the directory of xmls
         namespaces (Optional[List[str]] = None): Dictionary of namespaces
+        processes (Optional[int] = None): Number of processes to parse the files with, see parse_xml_files
 
     Return:
         Dict[str, Any] of parsed pandas tables from the xml directories.
@@ -683,11 +735,13 @@ def parse_xml_dir(
     """
 
     files = get_list_of_xml_files(xml_dir)
-    return parse_xml_files(files, namespaces)
+    return parse_xml_files(files, namespaces, processes)
 
 
 def parse_xml_files(
-    files: List[str], namespaces: Optional[List[str]] = None
+    files: List[str],
+    namespaces: Optional[List[str]] = None,
+    processes: Optional[int] = None,
 ) -> Dict[str, Any]:
     """Parses xml list of files and creates Pandas tables which contains
     a consolidated nodes, references, namespaces, and lookup_df
@@ -699,6 +753,10 @@ def parse_xml_files(
     Args:
         files (str): Full path of xml files
         namespaces (Optional[List[str]] = None): Dictionary of namespaces
+        processes (Optional[int] = None): Number of processes to parse the files with.
+            By default the files are parsed one after the other in this process.
+            The worker processes are spawned, so scripts using this must guard
+            their entry point with if __name__ == "__main__".
 
     Return:
         Dict[str, Any] of parsed pandas tables from the xml directories.
@@ -711,26 +769,46 @@ def parse_xml_files(
     if namespaces is None:
         namespaces = []
     df_nodes_list = []
-    df_references_list = []
+    reference_records = []
 
     files.sort()
     models = []
 
-    for file in files:
-        if not file.endswith(".xml"):
-            continue
+    xml_files = [file for file in files if file.endswith(".xml")]
+    for file in xml_files:
         if not os.path.exists(file):
             raise FileNotFoundError(
                 "The specified xml file does not exist or incorrect path was provided"
             )
 
-        logger.info("Started parsing " + str(file))
-        parse_dict = parse_xml_without_normalization(file, namespaces)
-        namespaces = parse_dict["namespaces"]
+    if processes is not None and processes > 1 and len(xml_files) > 1:
+        # Namespace indices are given in the order the files are parsed in, so
+        # the namespaces of all files are collected up front. Each worker then
+        # gets the complete list and maps its namespaces the same way.
+        if OPCFOUNDATION_NAMESPACE not in namespaces:
+            namespaces.append(OPCFOUNDATION_NAMESPACE)
+        for file in xml_files:
+            for line in iter_json_header_lines(file + "_parsed.json"):
+                if line["elem_type"] == "NamespaceUris":
+                    extend_namespace_map(namespaces, line["uris"], {})
+
+        logger.info(f"Started parsing {len(xml_files)} files in {processes} processes")
+        with multiprocessing.get_context("spawn").Pool(processes) as pool:
+            parse_dicts = pool.starmap(
+                parse_xml_records, [(file, list(namespaces)) for file in xml_files]
+            )
+        logger.info(f"Finished parsing {len(xml_files)} files")
+    else:
+        parse_dicts = []
+        for file in xml_files:
+            logger.info("Started parsing " + str(file))
+            parse_dicts.append(parse_xml_records(file, namespaces))
+            logger.info("Finished parsing " + str(file))
+
+    for parse_dict in parse_dicts:
         df_nodes_list.append(parse_dict["nodes"])
-        df_references_list.append((parse_dict["references"]))
-        models = list(itertools.chain(models, parse_dict["models"]))
-        logger.info("Finished parsing " + str(file))
+        reference_records.extend(parse_dict["reference_records"])
+        models.extend(parse_dict["models"])
 
     nodes = pd.concat(df_nodes_list, ignore_index=True)
     columns_to_fix_missing_values = [
@@ -745,11 +823,12 @@ def parse_xml_files(
         "MethodDeclarationId",
         "EventNotifier",
     ]
-    for column in columns_to_fix_missing_values:
-        if column in nodes.columns:
-            nodes[column] = nodes[column].replace({np.nan: pd.NA})
+    # Columns missing from some of the files are filled with NaN by concat
+    present_columns = [c for c in columns_to_fix_missing_values if c in nodes.columns]
+    present_values = nodes[present_columns]
+    nodes[present_columns] = present_values.mask(present_values.isna(), pd.NA)
 
-    references = pd.concat(df_references_list, ignore_index=True)
+    references = pd.DataFrame(reference_records, columns=REFERENCE_COLUMNS)
     lookup_df = normalize_wrt_nodeid(nodes, references)
 
     return {
@@ -2,7 +2,7 @@ import gc
 import logging
 from datetime import datetime
 from io import StringIO
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 
@@ -12,7 +12,6 @@ from opcua_tools.navigation import (
     fast_transitive_closure,
     find_relatives,
     hierarchical_references,
-    resolve_ids_from_browsenames,
 )
 from opcua_tools.nodeset_generator import (
     create_lookup_df,
@@ -46,6 +45,9 @@ class UAGraph:
         )
         self.namespaces = namespaces
         self.models = models
+        # Built on the first lookup by browsename, see __nodes_by_browsename
+        self._browsename_index: Optional[Dict[str, List[Tuple[str, int]]]] = None
+        self._browsename_index_nodes: Optional[pd.DataFrame] = None
 
     @classmethod
     def from_path(
@@ -106,6 +108,21 @@ class UAGraph:
             == self.reference_type_by_browsename(browsename)
         ].copy()
 
+    def __nodes_by_browsename(self) -> Dict[str, List[Tuple[str, int]]]:
+        """The NodeClass and internal id of the nodes with each BrowseName. The same few
+        type browsenames are looked up over and over, so the nodes are gone through once
+        instead of for every lookup. The index is built again when `nodes` is replaced.
+        """
+        if self._browsename_index_nodes is not self.nodes:
+            index = {}
+            for browsename, nodeclass, id in zip(
+                self.nodes["BrowseName"], self.nodes["NodeClass"], self.nodes["id"]
+            ):
+                index.setdefault(browsename, []).append((nodeclass, id))
+            self._browsename_index = index
+            self._browsename_index_nodes = self.nodes
+        return self._browsename_index
+
     def __ua_nodeclass_by_browsename(
         self, browsename: str, nodeclass: Optional[str] = None
     ) -> int:
@@ -130,20 +147,22 @@ class UAGraph:
                 f'"browsename" must not be None or empty string, should be BrowseName of {nodeclass}'
             )
 
+        browsename_nodes = self.__nodes_by_browsename().get(browsename, [])
         if nodeclass:
-            nodeclass_nodes = self.nodes[self.nodes["NodeClass"] == f"UA{nodeclass}"]
+            nodeclass_ids = [
+                id
+                for node_class, id in browsename_nodes
+                if node_class == f"UA{nodeclass}"
+            ]
         else:
-            nodeclass_nodes = self.nodes
+            nodeclass_ids = [id for _, id in browsename_nodes]
 
-        nodeclass_ids = resolve_ids_from_browsenames(
-            nodes=nodeclass_nodes, browsenames=[browsename]
-        )
         if len(nodeclass_ids) == 0:
             raise ValueError(f"Could not find {nodeclass} " + browsename)
         elif len(nodeclass_ids) > 1:
             raise ValueError(f"Multiple hits for {nodeclass} " + browsename + " found.")
         else:
-            nodeclass_id = nodeclass_ids.iloc[0]
+            nodeclass_id = nodeclass_ids[0]
         return int(nodeclass_id)
 
     def reference_type_by_browsename(self, browsename: str) -> int:
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import base64
+import binascii
 import copy
 import functools
 import re
@@ -67,6 +67,22 @@ simple = {
     "NodeId",
 }
 
+integer_types = {
+    "SByte": UASByte,
+    "Byte": UAByte,
+    "Int16": UAInt16,
+    "UInt16": UAUInt16,
+    "Int32": UAInt32,
+    "UInt32": UAUInt32,
+    "Int64": UAInt64,
+    "UInt64": UAUInt64,
+}
+
+floating_point_types = {
+    "Float": UAFloat,
+    "Double": UADouble,
+}
+
 tagsplit = re.compile(r"({.*\})(.*)")
 uaxsd = "{http://opcfoundation.org/UA/2008/02/Types.xsd}"
 
@@ -99,65 +115,8 @@ def parse_singular_value(val, tagtype):
             stripped = val.text.strip()
         else:
             stripped = None
-        if tagtype == "SByte":
-            if stripped:
-                return UASByte(value=int(stripped))
-
-            return UASByte(value=None)
-
-        elif tagtype == "Byte":
-            if stripped:
-                return UAByte(value=int(stripped))
-
-            return UAByte(value=None)
-
-        elif tagtype == "Int16":
-            if stripped:
-                return UAInt16(value=int(stripped))
-
-            return UAInt16(value=None)
-
-        elif tagtype == "UInt16":
-            if stripped:
-                return UAUInt16(value=int(stripped))
-
-            return UAUInt16(value=None)
-
-        elif tagtype == "Int32":
-            if stripped:
-                return UAInt32(value=int(stripped))
-
-            return UAInt32(value=None)
-
-        elif tagtype == "UInt32":
-            if stripped:
-                return UAUInt32(value=int(stripped))
-
-            return UAUInt32(value=None)
-
-        elif tagtype == "Int64":
-            if stripped:
-                return UAInt64(value=int(stripped))
-
-            return UAInt64(value=None)
-
-        elif tagtype == "UInt64":
-            if stripped:
-                return UAUInt64(value=int(stripped))
-
-            return UAUInt64(value=None)
-
-        elif tagtype == "Float":
-            if stripped:
-                return UAFloat(value=float(stripped))
-
-            return UAFloat(value=None)
-
-        elif tagtype == "Double":
-            if stripped:
-                return UADouble(value=float(stripped))
-
-            return UADouble(value=None)
+        if tagtype in integer_types or tagtype in floating_point_types:
+            return parse_number(tagtype, stripped)
 
         elif tagtype == "String":
             if stripped is not None:
@@ -177,7 +136,7 @@ def parse_singular_value(val, tagtype):
 
         elif tagtype == "ByteString":
             if stripped is not None:
-                return UAByteString(value=base64.b64decode(stripped))
+                return UAByteString(value=binascii.a2b_base64(stripped))
 
             return UAByteString(value=None)
 
@@ -248,6 +207,17 @@ def parse_singular_value(val, tagtype):
     raise NotImplementedError(tagtype)
 
 
+@functools.lru_cache(maxsize=65536)
+def parse_number(tagtype: str, stripped: Optional[str]):
+    """Numbers repeat a lot, long lists of them in particular. The data types are
+    immutable, so equal numbers share one instance instead of each having its own.
+    """
+    if tagtype in integer_types:
+        return integer_types[tagtype](value=int(stripped) if stripped else None)
+
+    return floating_point_types[tagtype](value=float(stripped) if stripped else None)
+
+
 @functools.cache
 def cached_parse_nodeid(
     nodeidstr: str,
@@ -273,16 +243,24 @@ def parse_nodeid(
     namespace_map: Optional[Dict[int, int]] = None,
     alias_map: Optional[Dict[str, UANodeId]] = None,
 ):
-    if alias_map is not None and nodeidstr in alias_map:
-        return alias_map[nodeidstr]
-
-    if namespace_map:
-        ns, nodeid_type, value = cached_parse_nodeid(nodeidstr)
+    if alias_map is not None:
+        alias = alias_map.get(nodeidstr)
+        if alias is not None:
+            return alias
+
+    ns, nodeid_type, value = cached_parse_nodeid(nodeidstr)
+    # Namespace 0 is always the OPC UA namespace and never needs remapping
+    if namespace_map and ns != 0:
         ns = namespace_map[ns]
 
-    else:
-        ns, nodeid_type, value = cached_parse_nodeid(nodeidstr)
+    return nodeid_instance(ns, nodeid_type, value)
+
 
+@functools.lru_cache(maxsize=65536)
+def nodeid_instance(ns: int, nodeid_type: NodeIdType, value: str) -> UANodeId:
+    """Like numbers, a node id is referenced from many places in a nodeset, so
+    equal node ids share one instance.
+    """
     return UANodeId(ns, nodeid_type, value)
 
 
@@ -307,6 +285,11 @@ def parse_localized_text(el):
     else:
         raise ValueError("Unexpected type for localized text locale")
 
+    return localized_text_instance(text, locale)
+
+
+@functools.lru_cache(maxsize=65536)
+def localized_text_instance(text, locale) -> UALocalizedText:
     return UALocalizedText(text=text, locale=locale)
 
 
@@ -324,26 +307,44 @@ def parse_engineering_units(el):
                 display_name = parse_localized_text(display_name_tag)
                 description_tag = euinfo.find(uaxsd + "Description")
                 description = parse_localized_text(description_tag)
-                return UAEngineeringUnits(
-                    display_name=display_name,
-                    description=description,
-                    unit_id=unit_id,
-                    namespace_uri=namespace_uri,
+                return engineering_units_instance(
+                    display_name, description, unit_id, namespace_uri
                 )
 
 
+@functools.lru_cache(maxsize=65536)
+def engineering_units_instance(
+    display_name: UALocalizedText,
+    description: UALocalizedText,
+    unit_id: int,
+    namespace_uri: str,
+) -> UAEngineeringUnits:
+    """The same few units are used by many variables, equal units share one
+    instance so that a column of values encodes each of them once.
+    """
+    return UAEngineeringUnits(
+        display_name=display_name,
+        description=description,
+        unit_id=unit_id,
+        namespace_uri=namespace_uri,
+    )
+
+
 def parse_eu_range(el):
     if el is not None:
         range_tag = el.find(uaxsd + "Range")
         if range_tag is not None:
             low_tag = range_tag.find(uaxsd + "Low")
-            low = float(low_tag.text.strip())
             high_tag = range_tag.find(uaxsd + "High")
-            high = float(high_tag.text.strip())
-            return UAEURange(
-                low=low,
-                high=high,
-            )
+            return eu_range_instance(low_tag.text.strip(), high_tag.text.strip())
+
+
+@functools.lru_cache(maxsize=65536)
+def eu_range_instance(low: str, high: str) -> UAEURange:
+    """Like units, ranges repeat. They are kept by their texts, as numbers are, so
+    that 0.0 and -0.0 do not end up sharing an instance.
+    """
+    return UAEURange(low=float(low), high=float(high))
 
 
 def parse_boolean(string):
@@ -3,6 +3,8 @@ import os.path
 from definitions import get_project_root
 
 from opcua_tools import nodeset_parser
+from opcua_tools.json_parser.parse import pre_process_xml_to_json
+from opcua_tools.ua_data_types import UAExtensionObject, UAXMLElement
 
 
 def test_get_namespace_data_from_file():
@@ -40,3 +42,45 @@ def test_get_namespace_data_should_have_empty_namespaces_data_regardless_file_na
         "included_namespaces": set(),
         "name": "http://opcfoundation.org/UA/",
     }
+
+
+INDENTED_EXTENSION_OBJECT_NODESET = """<?xml version="1.0" encoding="utf-8"?>
+<UANodeSet xmlns="http://opcfoundation.org/UA/2011/03/UANodeSet.xsd" xmlns:uax="http://opcfoundation.org/UA/2008/02/Types.xsd">
+  <NamespaceUris>
+    <Uri>http://example.com/whitespace</Uri>
+  </NamespaceUris>
+  <UAVariable NodeId="ns=1;i=1" BrowseName="1:Config" DataType="i=22">
+    <DisplayName>Config</DisplayName>
+    <Value>
+      <uax:ExtensionObject>
+        <uax:TypeId>
+          <uax:Identifier>ns=1;i=2</uax:Identifier>
+        </uax:TypeId>
+        <uax:Body>
+          <Config xmlns="http://example.com/whitespace/Types.xsd">
+            <Name>Pump</Name>
+            <Size>3</Size>
+          </Config>
+        </uax:Body>
+      </uax:ExtensionObject>
+    </Value>
+  </UAVariable>
+</UANodeSet>
+"""
+
+
+def test_xml_element_values_are_stored_without_indentation(tmp_path):
+    # The parser drops the whitespace between elements, so the text kept for an
+    # XmlElement, and written back as the ExtensionObject body, is not indented
+    xml_path = tmp_path / "indented.xml"
+    xml_path.write_text(INDENTED_EXTENSION_OBJECT_NODESET, encoding="utf-8")
+    pre_process_xml_to_json(str(xml_path))
+
+    nodes = nodeset_parser.parse_xml_records(str(xml_path))["nodes"]
+    value = nodes["Value"].iloc[0]
+
+    assert isinstance(value, UAExtensionObject)
+    assert value.body == UAXMLElement(
+        value='<Config xmlns="http://example.com/whitespace/Types.xsd">'
+        "<Name>Pump</Name><Size>3</Size></Config>"
+    )
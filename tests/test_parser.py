@@ -15,6 +15,7 @@
 import os
 from pathlib import Path
 
+import lxml.etree as ET
 import pandas as pd
 from definitions import get_project_root
 
@@ -25,6 +26,7 @@ from opcua_tools.nodeset_parser import (
     get_list_of_xml_files,
     get_xml_namespaces,
 )
+from opcua_tools.value_parser import parse_eu_range
 
 PATH_HERE = os.path.dirname(__file__)
 
@@ -44,6 +46,23 @@ def test_parse_nodeid():
     assert type(nid.value) == str
 
 
+def test_parse_eu_range_shares_equal_ranges():
+    def eu_range_body(low, high):
+        return ET.fromstring(
+            '<Body xmlns="http://opcfoundation.org/UA/2008/02/Types.xsd">'
+            f"<Range><Low>{low}</Low><High>{high}</High></Range></Body>"
+        )
+
+    eu_range = parse_eu_range(eu_range_body("0.0", "100"))
+    assert parse_eu_range(eu_range_body("0.0", "100")) is eu_range
+    # 0.0 and -0.0 are equal, but encode differently
+    negative_zero_eu_range = parse_eu_range(eu_range_body("-0.0", "100"))
+    assert negative_zero_eu_range is not eu_range
+    assert negative_zero_eu_range.xml_encode(include_xmlns=False) != (
+        eu_range.xml_encode(include_xmlns=False)
+    )
+
+
 def test_parser_easy_example_stays_put():
     gr = ot.UAGraph.from_path(PATH_HERE + "/testdata/generator")
     nodes = gr.get_normalized_nodes_df()
@@ -89,6 +108,22 @@ def test_parse_file_list():
     assert "models" in parse_dict
 
 
+def test_parse_file_list_in_processes(paper_example_path):
+    xml_list = get_list_of_xml_files(str(paper_example_path))
+    for f in xml_list:
+        pre_process_xml_to_json(f)
+
+    parse_dict = ot.parse_xml_files(list(xml_list))
+    parallel_parse_dict = ot.parse_xml_files(list(xml_list), processes=2)
+
+    assert parallel_parse_dict["namespaces"] == parse_dict["namespaces"]
+    assert parallel_parse_dict["models"] == parse_dict["models"]
+    pd.testing.assert_frame_equal(parallel_parse_dict["nodes"], parse_dict["nodes"])
+    pd.testing.assert_frame_equal(
+        parallel_parse_dict["references"], parse_dict["references"]
+    )
+
+
 def test_parse_no_namespace_list(paper_example_path):
     path_to_xmls = str(paper_example_path)
     ua_graph = ot.UAGraph.from_path(path_to_xmls)
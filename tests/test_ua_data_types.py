@@ -1,5 +1,8 @@
+import dataclasses
 import decimal
 import json
+import pickle
+import sys
 from datetime import datetime
 
 import pandas as pd
@@ -13,6 +16,7 @@ from opcua_tools.ua_data_types import (
     UADateTime,
     UADouble,
     UAEngineeringUnits,
+    UAEnumeration,
     UAEUInformation,
     UAEURange,
     UAExtensionObject,
@@ -20,6 +24,7 @@ from opcua_tools.ua_data_types import (
     UAInt16,
     UAInt32,
     UAInt64,
+    UAListOf,
     UALocalizedText,
     UANodeId,
     UAQualifiedName,
@@ -33,6 +38,8 @@ from opcua_tools.ua_data_types import (
     UAVariant,
     UAXMLElement,
     VariantType,
+    is_missing,
+    xml_encode_many,
 )
 
 
@@ -151,8 +158,10 @@ def test_ua_integer_json_encode_with_value():
     assert ua_uint16.json_encode() == "42"
     assert ua_int32.json_encode() == "42"
     assert ua_uint32.json_encode() == "42"
-    assert ua_int64.json_encode() == '"42.0"'
-    assert ua_uint64.json_encode() == '"42.0"'
+    assert ua_int64.json_encode() == '"42"'
+    assert ua_uint64.json_encode() == '"42"'
+    # Beyond 2**53 the value would not survive a conversion to float
+    assert UAInt64(value=2**53 + 1).json_encode() == '"9007199254740993"'
 
 
 def test_ua_integer_json_encode_with_none_value():
@@ -666,6 +675,14 @@ def test_ua_localized_text_json_encode_with_input_locale():
     actual_json = ua_localized_text.json_encode(input_locale="de-DE")
     assert actual_json == expected_json
 
+    # Testing that a kept encoding is not reused for another input_locale
+    expected_json = '{"Text":"foo","Locale":"nb-NO"}'
+    actual_json = ua_localized_text.json_encode(input_locale="nb-NO")
+    assert actual_json == expected_json
+    assert ua_localized_text.json_encode() == '{"Text":"foo"}'
+    expected_json = '{"Text":"foo","Locale":"de-DE"}'
+    assert ua_localized_text.json_encode(input_locale="de-DE") == expected_json
+
 
 def test_ua_localized_text_json_encode_with_value():
     ua_localized_text = UALocalizedText(text="foo", locale="en-US")
@@ -1009,12 +1026,12 @@ def test_ua_variant_json_encode_with_value():
     assert actual_json == expected_json
 
     ua_variant = UAVariant(value=UAInt64(153), type=VariantType.Int64)
-    expected_json = '{"Type":8,"Body":"153.0"}'
+    expected_json = '{"Type":8,"Body":"153"}'
     actual_json = ua_variant.json_encode()
     assert actual_json == expected_json
 
     ua_variant = UAVariant(value=UAUInt64(153), type=VariantType.UInt64)
-    expected_json = '{"Type":9,"Body":"153.0"}'
+    expected_json = '{"Type":9,"Body":"153"}'
     actual_json = ua_variant.json_encode()
     assert actual_json == expected_json
 
@@ -1207,6 +1224,19 @@ def test_ua_eu_information_json_encode():
     expected_json = '{"DisplayName":{"Text":"bar","Locale":"en"},"Description":{"Text":"bar","Locale":"en"},"UnitId":42,"NamespaceUri":"www.mynamespace.com/"}'
     assert actual_json == expected_json
 
+    ua_eu_information = UAEUInformation(
+        namespace_uri='www.mynamespace.com/"quoted"',
+        unit_id=42,
+        display_name="bar",
+        description="baz",
+    )
+    assert json.loads(ua_eu_information.json_encode()) == {
+        "DisplayName": {"Text": "bar"},
+        "Description": {"Text": "baz"},
+        "UnitId": 42,
+        "NamespaceUri": 'www.mynamespace.com/"quoted"',
+    }
+
 
 def test_ua_engineering_units_creation_with_incorrect_values():
     # Incorrect display name type
@@ -1354,3 +1384,141 @@ def test_ua_eurange_json_encode_with_value():
     expected_json = '{"TypeId":{"Id":885},"Body":{"Low":0.0,"High":100.0}}'
     actual_json = ua_eurange.json_encode()
     assert actual_json == expected_json
+
+
+def test_ua_data_ordering_is_numeric():
+    assert UAInt32(2) < UAInt32(10)
+    assert UADouble(9.5) <= UADouble(10.0)
+    assert sorted([UAInt32(10), UAInt32(), UAInt32(2)]) == [
+        UAInt32(),
+        UAInt32(2),
+        UAInt32(10),
+    ]
+    assert UARange(low=2.0, high=20.0) < UARange(low=10.0, high=20.0)
+    assert UAEURange(low=9.5, high=20.0) <= UAEURange(low=10.0, high=11.0)
+
+
+def test_ua_data_ordering_with_mixed_field_types():
+    string_nodeid = UANodeId(0, NodeIdType.STRING, "a")
+    numeric_nodeid = UANodeId(0, NodeIdType.NUMERIC, "5")
+    assert sorted([string_nodeid, numeric_nodeid]) == [numeric_nodeid, string_nodeid]
+    assert UADouble(float("nan")) < UADouble(1.0)
+
+
+def test_ua_list_of_creation_with_mixed_types():
+    with pytest.raises(TypeError):
+        UAListOf(value=(UAInt32(1), UAString("a")), typename="Int32")
+    # Subclasses of the first element type are accepted
+    ua_list = UAListOf(
+        value=(UAInt32(1), UAEnumeration(2, "Two", "Enum")), typename="Int32"
+    )
+    assert len(ua_list.value) == 2
+
+
+def test_ua_list_of_xml_encode():
+    ua_list = UAListOf(value=(UAInt32(1), UAInt32(), UAInt32(3)), typename="Int32")
+    expected_xml = (
+        "<ListOfInt32 ><Int32>1</Int32><Int32></Int32><Int32>3</Int32></ListOfInt32>"
+    )
+    assert ua_list.xml_encode(include_xmlns=False) == expected_xml
+
+    ua_list = UAListOf(
+        value=(UALocalizedText(text="a & b", locale="en"),), typename="LocalizedText"
+    )
+    expected_xml = '<ListOfLocalizedText  xmlns="http://opcfoundation.org/UA/2008/02/Types.xsd"><LocalizedText><Locale>en</Locale><Text>a &amp; b</Text></LocalizedText></ListOfLocalizedText>'
+    assert ua_list.xml_encode(include_xmlns=True) == expected_xml
+
+
+def test_is_missing_matches_pd_isna_for_field_values():
+    values = [None, pd.NA, pd.NaT, float("nan"), "", "a", 0, 0.0, UAInt32(1), ()]
+    for value in values:
+        assert is_missing(value) == pd.isna(value)
+
+
+def test_ua_list_of_json_encode():
+    ua_list = UAListOf(value=(UAInt32(1), UAInt32(2), UAInt32(3)), typename="Int32")
+    assert ua_list.json_encode() == '{"Type":6,"Body":[1,2,3]}'
+
+    # Elements without a value can not be encoded this way
+    ua_list = UAListOf(value=(UALocalizedText(text="a"),), typename="LocalizedText")
+    with pytest.raises(AttributeError):
+        ua_list.json_encode()
+
+
+def test_xml_encode_many():
+    values = [
+        UAInt32(1),
+        UAString("a"),
+        UAInt32(1),
+        UAEnumeration(1, "One", "Enum"),
+        UADouble(0.0),
+        UADouble(-0.0),
+    ]
+    assert xml_encode_many(values, include_xmlns=False) == [
+        value.xml_encode(include_xmlns=False) for value in values
+    ]
+
+
+def test_xml_encode_many_with_values_made_on_the_fly():
+    # Values made by a generator are freed as soon as they are encoded, so a new
+    # value may get the address of an old one
+    values = [UAString("a" * length) for length in range(1, 301)]
+    assert xml_encode_many(
+        (UAString(value.value) for value in values), include_xmlns=False
+    ) == [value.xml_encode(include_xmlns=False) for value in values]
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10")
+def test_ua_data_is_slotted_and_pickles_with_cached_encodings():
+    values = [
+        UAInt32(1),
+        UADouble(1.5),
+        UAString("a"),
+        UANodeId(1, NodeIdType.NUMERIC, "5"),
+        UALocalizedText(text="a", locale="en"),
+        UARange(low=0.0, high=1.0),
+        UAEURange(low=0.0, high=1.0),
+        UAEUInformation(
+            display_name="Hz", description="hertz", unit_id=1, namespace_uri="u"
+        ),
+        UAEngineeringUnits(
+            display_name="Hz", description="hertz", unit_id=1, namespace_uri="u"
+        ),
+        UAListOf(value=(UAInt32(1),), typename="Int32"),
+    ]
+    for value in values:
+        assert not hasattr(value, "__dict__")
+        value.json_encode()
+        value.sort_key()
+        xml = value.xml_encode(include_xmlns=False)
+        xml_with_xmlns = value.xml_encode(include_xmlns=True)
+        assert xml != xml_with_xmlns
+        assert value.xml_encode(include_xmlns=False) == xml
+        assert pickle.loads(pickle.dumps(value)) == value
+
+
+def test_cached_texts_are_not_dataclass_fields():
+    nodeid = UANodeId(1, NodeIdType.NUMERIC, "5")
+    assert str(nodeid) == "ns=1;i=5"
+    assert [f.name for f in dataclasses.fields(nodeid)] == [
+        "namespace",
+        "nodeid_type",
+        "value",
+    ]
+    assert dataclasses.astuple(nodeid) == (1, NodeIdType.NUMERIC, "5")
+    assert str(pickle.loads(pickle.dumps(nodeid))) == "ns=1;i=5"
+
+    byte_string = UAByteString(b"abc")
+    assert byte_string.json_encode() == '"YWJj"'
+    assert [f.name for f in dataclasses.fields(byte_string)] == ["value"]
+    assert dataclasses.asdict(byte_string) == {"value": b"abc"}
+    assert pickle.loads(pickle.dumps(byte_string)).xml_text() == "YWJj"
+
+    date_time = UADateTime(datetime(2023, 5, 8, 14, 30))
+    assert date_time.json_encode() == '"2023-05-08T14:30:00.000000Z"'
+    assert [f.name for f in dataclasses.fields(date_time)] == ["value"]
+    assert dataclasses.astuple(date_time) == (datetime(2023, 5, 8, 14, 30),)
+    assert (
+        pickle.loads(pickle.dumps(date_time)).xml_text()
+        == "2023-05-08T14:30:00.000000Z"
+    )
@@ -15,6 +15,7 @@
 import os
 
 import pandas as pd
+import pytest
 
 import opcua_tools as ot
 from opcua_tools.ua_data_types import NodeIdType, UANodeId
@@ -90,6 +91,21 @@ def test_ua_graph_object_by_browsename(paper_example_path):
     assert objects == 3909
 
 
+def test_ua_graph_by_browsename_follows_replaced_nodes(paper_example_path):
+    ua_graph = ot.UAGraph.from_path(str(paper_example_path))
+
+    with pytest.raises(ValueError):
+        ua_graph.object_by_browsename("NoSuchObject")
+
+    assert ua_graph.object_by_browsename("Site1") == 3909
+    nodes = ua_graph.nodes.copy()
+    nodes.loc[nodes["id"] == 3909, "BrowseName"] = "RenamedSite1"
+    ua_graph.nodes = nodes
+    assert ua_graph.object_by_browsename("RenamedSite1") == 3909
+    with pytest.raises(ValueError):
+        ua_graph.object_by_browsename("Site1")
+
+
 def test_ua_graph_nodeid_by_browsename_without_nodeclass(paper_example_path):
     ua_graph = ot.UAGraph.from_path(str(paper_example_path))
 